@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
 from pathlib import Path
+from typing import Optional
 
 import click
 
@@ -16,6 +18,15 @@ from marimo._utils.file_watcher import FileWatcher
 from marimo._utils.paths import maybe_make_dirs
 
 
+def _contents_digest(file_path: Path) -> str:
+    """Digest of a notebook's contents, for skipping no-op re-exports.
+
+    Watchers can fire on metadata-only changes (e.g. `touch`); when the
+    contents are unchanged, re-running the notebook is wasted work.
+    """
+    return hashlib.sha256(file_path.read_bytes()).hexdigest()
+
+
 @click.group(help="""Export a notebook to various formats.""")
 def export() -> None:
     pass
@@ -102,7 +113,14 @@ def html(
         write_html(html)
         return
 
+    last_digest: Optional[str] = None
+
     async def on_file_changed(file_path: Path) -> None:
+        nonlocal last_digest
+        digest = _contents_digest(file_path)
+        if digest == last_digest:
+            return
+        last_digest = digest
         click.echo(
             f"File {str(file_path)} changed. Re-exporting to {green(output)}"
         )
@@ -193,7 +211,14 @@ def script(
         write_script(html)
         return
 
+    last_digest: Optional[str] = None
+
     async def on_file_changed(file_path: Path) -> None:
+        nonlocal last_digest
+        digest = _contents_digest(file_path)
+        if digest == last_digest:
+            return
+        last_digest = digest
         click.echo(
             f"File {str(file_path)} changed. Re-exporting to {green(output)}"
         )
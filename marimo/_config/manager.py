@@ -21,12 +21,17 @@ class UserConfigManager:
         self.config = load_config()
 
     def save_config(self, config: MarimoConfig) -> MarimoConfig:
-        config_path = self._get_config_path()
-        LOGGER.debug("Saving user configuration to %s", config_path)
         # Remove the secret placeholders from the incoming config
         config = remove_secret_placeholders(config)
         # Merge the current config with the new config
         merged = merge_config(self.config, config)
+        # Frontends save eagerly; skip the disk write when nothing changed
+        if merged == self.config:
+            LOGGER.debug("User configuration unchanged; skipping write")
+            return self.config
+
+        config_path = self._get_config_path()
+        LOGGER.debug("Saving user configuration to %s", config_path)
         with open(config_path, "w", encoding="utf-8") as f:
             tomlkit.dump(merged, f)
 
@@ -48,10 +48,12 @@ def accordion(
     """
 
     def render_content(tab: object) -> str:
-        if lazy:
-            return lazy_ui(tab).text
         if isinstance(tab, str):
+            # Static markdown is already materialized; lazily loading
+            # it would cost a kernel round-trip for nothing.
             return md(tab).text
+        if lazy:
+            return lazy_ui(tab).text
         return as_html(tab).text
 
     item_labels = list(md(label).text for label in items.keys())
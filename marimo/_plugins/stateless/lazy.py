@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Final, Union
+from typing import Callable, Final, Optional, Tuple, Union
 
 from marimo._output.formatting import as_html
 from marimo._output.rich_help import mddoc
@@ -44,12 +44,27 @@ class lazy(UIElement[None, None]):
     accordion = mo.ui.accordion({"Charts": mo.lazy(expensive_component)})
     ```
 
+    Cache a function's output across reveals by declaring what it depends
+    on:
+
+    ```python
+    tabs = mo.ui.tabs(
+        {"Overview": tab1, "Charts": mo.lazy(expensive_component, deps=())}
+    )
+    ```
+
     **Initialization Args.**
 
     - `element`: object or callable that returns content to be lazily loaded
     - `show_loading_indicator`: a boolean, whether to show a loading
         indicator while the content is being loaded.
         Default is `False`.
+    - `deps`: an optional tuple of hashable values the computed content
+        depends on. When provided and the function has already been invoked
+        with the same dependency values, the cached content is reused
+        instead of invoking the function again (e.g., when switching back
+        to a lazy tab). Pass `()` for a function whose output only needs to
+        be computed once.
     """
 
     _name: Final[str] = "marimo-lazy"
@@ -58,8 +73,12 @@ class lazy(UIElement[None, None]):
         self,
         element: Union[Callable[[], object], object],
         show_loading_indicator: bool = False,
+        deps: Optional[Tuple[object, ...]] = None,
     ) -> None:
         self._element = element
+        self._deps = deps
+        self._cached_key: Optional[int] = None
+        self._cached_response: Optional[LoadResponse] = None
 
         super().__init__(
             component_name=self._name,
@@ -85,7 +104,17 @@ class lazy(UIElement[None, None]):
         if callable(self._element) and not isinstance(
             self._element, UIElement
         ):
-            el = self._element()
-            return LoadResponse(html=as_html(el).text)
+            if self._deps is None:
+                return LoadResponse(html=as_html(self._element()).text)
+            # Reuse the cached content when the declared dependencies
+            # haven't changed, so re-revealing the element doesn't
+            # re-invoke the function.
+            key = hash(self._deps)
+            if self._cached_response is None or key != self._cached_key:
+                self._cached_key = key
+                self._cached_response = LoadResponse(
+                    html=as_html(self._element()).text
+                )
+            return self._cached_response
         else:
             return LoadResponse(html=as_html(self._element).text)
@@ -75,10 +75,12 @@ class tabs(UIElement[str, str]):
         on_change: Optional[Callable[[str], None]] = None,
     ) -> None:
         def render_content(tab: object) -> str:
-            if lazy:
-                return lazy_ui(tab).text
             if isinstance(tab, str):
+                # Static markdown is already materialized; lazily loading
+                # it would cost a kernel round-trip for nothing.
                 return md(tab).text
+            if lazy:
+                return lazy_ui(tab).text
             return as_html(tab).text
 
         tab_items = "".join(
@@ -37,12 +37,18 @@ async def save_user_config(
     """
     app_state = AppState(request)
     body = await parse_request(request, cls=SaveUserConfigurationRequest)
+    prev_config = app_state.config_manager.get_config(hide_secrets=False)
     config = app_state.config_manager.save_config(body.config)
+    if config == prev_config:
+        # No-op save: nothing to broadcast to the kernel
+        return SuccessResponse()
 
-    # Update the server's view of the config
+    # Update the server's view of the config; the LSP server takes
+    # hundreds of ms to spawn, so don't block the response on it
+    # (start_lsp_server is a no-op if the server is already running)
     if config["completion"]["copilot"]:
         LOGGER.debug("Starting copilot server")
-        await app_state.session_manager.start_lsp_server()
+        app_state.session_manager.start_lsp_server_in_background()
 
     # Update the kernel's view of the config
     app_state.require_current_session().put_control_request(
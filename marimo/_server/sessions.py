@@ -14,6 +14,7 @@ even if its socket is closed.
 
 from __future__ import annotations
 
+import asyncio
 import multiprocessing as mp
 import os
 import queue
@@ -405,6 +406,15 @@ class Session:
         )
 
 
+def _log_lsp_start_failure(task: asyncio.Task[None]) -> None:
+    """Surfaces exceptions from a background LSP startup task."""
+    if task.cancelled():
+        return
+    exception = task.exception()
+    if exception is not None:
+        LOGGER.error("Failed to start LSP server: %s", exception)
+
+
 class SessionManager:
     """Mapping from client session IDs to sessions.
 
@@ -435,6 +445,7 @@ class SessionManager:
         self.sessions: dict[SessionId, Session] = {}
         self.include_code = include_code
         self.lsp_server = lsp_server
+        self._lsp_start_task: Optional[asyncio.Task[None]] = None
         self.watcher: Optional[FileWatcher] = None
         self.recents = RecentFilesManager()
         self.user_config_manager = user_config_manager
@@ -577,6 +588,19 @@ class SessionManager:
                 await session.write_operation(alert)
             return
 
+    def start_lsp_server_in_background(self) -> None:
+        """Starts the lsp server without blocking the caller.
+
+        Holds a reference to the task -- the event loop only keeps a weak
+        one, so a bare create_task could be garbage-collected mid-startup
+        -- and reuses an in-flight startup instead of spawning another.
+        """
+        task = self._lsp_start_task
+        if task is not None and not task.done():
+            return
+        self._lsp_start_task = asyncio.create_task(self.start_lsp_server())
+        self._lsp_start_task.add_done_callback(_log_lsp_start_failure)
+
     def close_session(self, session_id: SessionId) -> bool:
         LOGGER.debug("Closing session %s", session_id)
         session = self.get_session(session_id)
@@ -7,12 +7,14 @@ app = marimo.App(width="full")
 
 
 @app.cell
-def __(generate_number, mo, table):
+def __(generate_number, load_table, mo):
     tabs = mo.ui.tabs(
         {
             "First": "",
-            "Second": mo.lazy(table),
-            "Third": mo.lazy(generate_number, show_loading_indicator=True),
+            "Second": mo.lazy(load_table),
+            "Third": mo.lazy(
+                generate_number, show_loading_indicator=True, deps=()
+            ),
         }
     )
     tabs
@@ -20,11 +22,11 @@ def __(generate_number, mo, table):
 
 
 @app.cell
-def __(generate_number, mo, table):
+def __(generate_number, load_table, mo):
     auto_lazy_tabs = mo.ui.tabs(
         {
             "First": "",
-            "Second": table,
+            "Second": load_table,
             "Third": generate_number,
         },
         lazy=True,
@@ -35,7 +37,13 @@ def __(generate_number, mo, table):
 
 @app.cell
 def __(generate_number, mo):
-    mo.accordion({"Open me": mo.lazy(generate_number, show_loading_indicator=True)})
+    mo.accordion(
+        {
+            "Open me": mo.lazy(
+                generate_number, show_loading_indicator=True, deps=()
+            )
+        }
+    )
     return
 
 
@@ -56,17 +64,27 @@ def __(random, time):
     return generate_number,
 
 
+@app.cell
+def __(mo):
+    def load_table():
+        # Import and load inside the loader so opening the notebook
+        # doesn't pay the pandas + vega_datasets cost; it's deferred
+        # until a lazy tab is revealed.
+        import pyarrow as pa
+        import vega_datasets
+
+        cars = vega_datasets.data.cars()
+        # Arrow tables take the zero-copy path through mo.ui.table
+        return mo.ui.table(pa.Table.from_pandas(cars))
+    return load_table,
+
+
 @app.cell
 def __():
     import marimo as mo
-    import pandas as pd
     import random
     import time
-    import vega_datasets
-
-    cars = vega_datasets.data.cars()
-    table = mo.ui.table(cars)
-    return cars, mo, pd, random, table, time, vega_datasets
+    return mo, random, time
 
 
 if __name__ == "__main__":
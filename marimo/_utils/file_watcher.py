@@ -45,7 +45,9 @@ class FileWatcher(ABC):
 
 
 class PollingFileWatcher(FileWatcher):
-    POLL_SECONDS = 1.0  # Poll every 1s
+    # Poll every 1s by default; overridable via MARIMO_WATCH_INTERVAL_MS,
+    # e.g. for tests that want fast change detection.
+    POLL_SECONDS = int(os.getenv("MARIMO_WATCH_INTERVAL_MS", 1000)) / 1000
 
     def __init__(
         self,
@@ -56,7 +58,11 @@ class PollingFileWatcher(FileWatcher):
         super().__init__(path, callback)
         self._running = False
         self.loop = loop
-        self.last_modified: Optional[float] = None
+        # Take the baseline mtime eagerly so that a modification made
+        # between construction and the first poll is not missed.
+        self.last_modified: Optional[float] = (
+            os.path.getmtime(path) if os.path.exists(path) else None
+        )
 
     def start(self) -> None:
         self._running = True
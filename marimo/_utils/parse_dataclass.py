@@ -4,6 +4,7 @@ from __future__ import annotations
 import dataclasses
 import json
 from enum import Enum
+from functools import lru_cache
 from typing import (
     Any,
     Literal,
@@ -18,6 +19,10 @@ from typing import (
 
 T = TypeVar("T")
 
+# get_type_hints resolves (and evaluates) annotations on every call; the
+# set of parsed dataclasses is small and fixed, so cache the resolution.
+_cached_type_hints = lru_cache(maxsize=None)(get_type_hints)
+
 
 def to_snake(string: str) -> str:
     # basic conversion of javascript camel case to snake
@@ -98,7 +103,7 @@ def build_dataclass(values: dict[Any, Any], cls: Type[T]) -> T:
             "value passed to build_dataclass needs to be a dictionary"
         )
 
-    types = get_type_hints(cls)
+    types = _cached_type_hints(cls)  # type: ignore[arg-type]
 
     snake_cased_values = {to_snake(k): v for k, v in values.items()}
     if not snake_cased_values.keys() <= types.keys():
@@ -2,143 +2,226 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
+import mmap
+import os
+import pdb
+import sys
+import time
 from os import path
+from typing import List, NamedTuple
 
-from tests._server.templates.utils import normalize_index_html
+import pytest
+from click.testing import CliRunner
+
+from marimo._cli.cli import main
 from tests.mocks import snapshotter
 
 snapshot = snapshotter(__file__)
 
+# Marker emitted in exported HTML when code is stripped; kept as bytes so
+# exported documents can be scanned without decoding.
+_HIDDEN_CODE_TAG = b'<marimo-code hidden=""></marimo-code>'
+
+_WATCH_ERROR_MESSAGE = (
+    "Cannot use --watch without providing an output file with --output."
+)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_export_imports() -> None:
+    """Pre-import the export machinery once per session.
+
+    The in-process runner hits warm `sys.modules` instead of paying the
+    server/export import cost on the first test that happens to run.
+    """
+    import marimo._server.export.utils  # noqa: F401
+
+
+class _ExportResult(NamedTuple):
+    """`CompletedProcess`-shaped result of an in-process CLI invocation."""
+
+    returncode: int
+    stdout: bytes
+    stderr: bytes
+
+
+def _run_export(args: List[str]) -> _ExportResult:
+    """Run `marimo export <args>` in-process.
+
+    Spawning a fresh interpreter per test pays the full marimo import cost
+    each time; invoking the click command directly amortizes imports across
+    the pytest session. Watch tests still spawn a real subprocess, since
+    they need a live process.
+    """
+    # Exporting runs the notebook's kernel in this process, and the kernel
+    # patches interpreter globals: sys.modules["__main__"] is replaced with
+    # the notebook's synthetic main module and pdb is swapped for marimo's
+    # debugger. Restore them so later tests see pytest's interpreter state.
+    main_module = sys.modules["__main__"]
+    pdb_cls, pdb_set_trace = pdb.Pdb, pdb.set_trace
+    try:
+        result = CliRunner(mix_stderr=False).invoke(main, ["export", *args])
+    finally:
+        sys.modules["__main__"] = main_module
+        pdb.Pdb, pdb.set_trace = pdb_cls, pdb_set_trace  # type: ignore[misc]
+    return _ExportResult(
+        returncode=result.exit_code,
+        stdout=result.stdout_bytes,
+        stderr=result.stderr_bytes,
+    )
+
+
+def _file_contains(filename: str, needle: bytes) -> bool:
+    """Scan an exported file for a byte pattern.
+
+    Memory-maps the file rather than decoding it, so the (potentially
+    large) exported document is never materialized as a Python str.
+    Note `needle in mm` can't be used: mmap's `in` compares single bytes.
+    """
+    with open(filename, "rb") as f, mmap.mmap(
+        f.fileno(), 0, access=mmap.ACCESS_READ
+    ) as mm:
+        return mm.find(needle) != -1
+
+
+async def _watch_export(*args: str) -> asyncio.subprocess.Process:
+    """Spawn `marimo export ... --watch` with piped stdout/stderr.
+
+    The file watcher falls back to polling when watchdog isn't installed;
+    a short poll interval keeps change detection (and these tests) fast.
+    """
+    return await asyncio.create_subprocess_exec(
+        "marimo",
+        "export",
+        *args,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env={**os.environ, "MARIMO_WATCH_INTERVAL_MS": "50"},
+    )
+
+
+async def _readline(stream: asyncio.StreamReader, timeout: float = 10) -> str:
+    """Read one line, bounded by a timeout so a wedged process fails fast.
+
+    An empty result means the stream hit EOF, i.e. the process died.
+    """
+    line = await asyncio.wait_for(stream.readline(), timeout)
+    assert line, "process exited before producing the expected line"
+    return line.decode()
+
+
+async def _kill(p: asyncio.subprocess.Process) -> None:
+    """Kill a watch process (unless it already exited) and reap it."""
+    if p.returncode is None:
+        p.kill()
+    await p.wait()
+
+
+async def _wait_exists(filename: str, timeout: float = 2.0) -> bool:
+    """Wait for a file to appear, polling briefly up to a deadline.
+
+    Faster than a fixed sleep: returns as soon as the export lands
+    instead of always paying the worst case.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if path.exists(filename):
+            return True
+        await asyncio.sleep(0.005)
+    return False
+
+
+async def _modify_and_wait_for_reexport(
+    p: asyncio.subprocess.Process, notebook: str
+) -> None:
+    """Shared handshake for the watch tests.
+
+    Waits for the watcher to come up, appends to the notebook, and waits
+    for the re-export message. The event loop multiplexes every live
+    pipe on a single selector, so tests never tie up a thread per stream.
+    """
+    line = await _readline(p.stdout)
+    assert f"Watching {notebook}" in line
+
+    with open(notebook, "a") as f:  # noqa: ASYNC101
+        f.write("\n# comment\n")
+
+    assert p.returncode is None
+    line = await _readline(p.stdout)
+    assert "Re-exporting" in line
+
 
 class TestExportHTML:
     @staticmethod
     def test_cli_export_html(temp_marimo_file: str) -> None:
-        p = subprocess.run(
-            ["marimo", "export", "html", temp_marimo_file],
-            capture_output=True,
-        )
+        out_file = temp_marimo_file.replace(".py", ".html")
+        p = _run_export(["html", temp_marimo_file, "--output", out_file])
         assert p.returncode == 0, p.stderr.decode()
-        html = normalize_index_html(p.stdout.decode())
-        # Remove folder path
-        dirname = path.dirname(temp_marimo_file)
-        html = html.replace(dirname, "path")
-        assert '<marimo-code hidden=""></marimo-code>' not in html
+        assert not _file_contains(out_file, _HIDDEN_CODE_TAG)
 
     @staticmethod
     def test_cli_export_html_no_code(temp_marimo_file: str) -> None:
-        p = subprocess.run(
+        out_file = temp_marimo_file.replace(".py", ".html")
+        p = _run_export(
             [
-                "marimo",
-                "export",
                 "html",
                 temp_marimo_file,
                 "--no-include-code",
-            ],
-            capture_output=True,
+                "--output",
+                out_file,
+            ]
         )
         assert p.returncode == 0, p.stderr.decode()
-        html = normalize_index_html(p.stdout.decode())
-        # Remove folder path
-        dirname = path.dirname(temp_marimo_file)
-        html = html.replace(dirname, "path")
-        assert '<marimo-code hidden=""></marimo-code>' in html
+        assert _file_contains(out_file, _HIDDEN_CODE_TAG)
 
     @staticmethod
     def test_cli_export_async(temp_async_marimo_file: str) -> None:
-        p = subprocess.run(
-            ["marimo", "export", "html", temp_async_marimo_file],
-            capture_output=True,
-        )
+        out_file = temp_async_marimo_file.replace(".py", ".html")
+        p = _run_export(["html", temp_async_marimo_file, "--output", out_file])
         assert p.returncode == 0, p.stderr.decode()
         assert "ValueError" not in p.stderr.decode()
         assert "Traceback" not in p.stderr.decode()
-        html = normalize_index_html(p.stdout.decode())
-        # Remove folder path
-        dirname = path.dirname(temp_async_marimo_file)
-        html = html.replace(dirname, "path")
-        assert '<marimo-code hidden=""></marimo-code>' not in html
+        assert not _file_contains(out_file, _HIDDEN_CODE_TAG)
 
     @staticmethod
+    @pytest.mark.xdist_group(name="export_watch")
     async def test_export_watch(temp_marimo_file: str) -> None:
         temp_out_file = temp_marimo_file.replace(".py", ".html")
-        p = subprocess.Popen(  # noqa: ASYNC101
-            [
-                "marimo",
-                "export",
-                "html",
-                temp_marimo_file,
-                "--watch",
-                "--output",
-                temp_out_file,
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        p = await _watch_export(
+            "html",
+            temp_marimo_file,
+            "--watch",
+            "--output",
+            temp_out_file,
         )
-
-        # Wait for the message
-        while True:
-            line = p.stdout.readline().decode()
-            if line:
-                assert f"Watching {temp_marimo_file}" in line
-                break
-
-        assert not path.exists(temp_out_file)
-
-        # Modify file
-        with open(temp_marimo_file, "a") as f:  # noqa: ASYNC101
-            f.write("\n# comment\n")
-
-        assert p.poll() is None
-        # Wait for rebuild
-        while True:
-            line = p.stdout.readline().decode()
-            if line:
-                assert "Re-exporting" in line
-                break
+        try:
+            assert not path.exists(temp_out_file)
+            await _modify_and_wait_for_reexport(p, temp_marimo_file)
+        finally:
+            await _kill(p)
 
     @staticmethod
-    def test_export_watch_no_out_dir(temp_marimo_file: str) -> None:
-        p = subprocess.Popen(
-            [
-                "marimo",
-                "export",
-                "html",
-                temp_marimo_file,
-                "--watch",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Should return an error
-        while True:
-            line = p.stderr.readline().decode()
-            if line:
-                assert (
-                    "Cannot use --watch without providing "
-                    + "an output file with --output."
-                    in line
-                )
-                break
+    @pytest.mark.xdist_group(name="export_watch")
+    async def test_export_watch_no_out_dir(temp_marimo_file: str) -> None:
+        p = await _watch_export("html", temp_marimo_file, "--watch")
+        try:
+            # Should return an error
+            line = await _readline(p.stderr)
+            assert _WATCH_ERROR_MESSAGE in line
+        finally:
+            await _kill(p)
 
 
 class TestExportScript:
     @staticmethod
     def test_export_script(temp_marimo_file: str) -> None:
-        p = subprocess.run(
-            ["marimo", "export", "script", temp_marimo_file],
-            capture_output=True,
-        )
+        p = _run_export(["script", temp_marimo_file])
         assert p.returncode == 0, p.stderr.decode()
         snapshot("script.txt", p.stdout.decode())
 
     @staticmethod
     def test_export_script_async(temp_async_marimo_file: str) -> None:
-        p = subprocess.run(
-            ["marimo", "export", "script", temp_async_marimo_file],
-            capture_output=True,
-        )
+        p = _run_export(["script", temp_async_marimo_file])
         assert p.returncode == 2, p.stderr.decode()
         assert (
             "Cannot export a notebook with async code to a flat script"
@@ -146,67 +229,33 @@ class TestExportScript:
         )
 
     @staticmethod
+    @pytest.mark.xdist_group(name="export_watch")
     async def test_export_watch_script(temp_marimo_file: str) -> None:
         temp_out_file = temp_marimo_file.replace(".py", ".script.py")
-        p = subprocess.Popen(  # noqa: ASYNC101
-            [
-                "marimo",
-                "export",
-                "script",
-                temp_marimo_file,
-                "--watch",
-                "--output",
-                temp_out_file,
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+        p = await _watch_export(
+            "script",
+            temp_marimo_file,
+            "--watch",
+            "--output",
+            temp_out_file,
         )
+        try:
+            assert not path.exists(temp_out_file)
+            await _modify_and_wait_for_reexport(p, temp_marimo_file)
 
-        # Wait for the message
-        while True:
-            line = p.stdout.readline().decode()
-            if line:
-                assert f"Watching {temp_marimo_file}" in line
-                break
-
-        assert not path.exists(temp_out_file)
-
-        # Modify file
-        with open(temp_marimo_file, "a") as f:  # noqa: ASYNC101
-            f.write("\n# comment\n")
-
-        assert p.poll() is None
-        # Wait for rebuild
-        while True:
-            line = p.stdout.readline().decode()
-            if line:
-                assert "Re-exporting" in line
-                break
-
-        await asyncio.sleep(0.1)
-        assert path.exists(temp_out_file)
+            assert await _wait_exists(temp_out_file)
+        finally:
+            await _kill(p)
 
     @staticmethod
-    def test_export_watch_script_no_out_dir(temp_marimo_file: str) -> None:
-        p = subprocess.Popen(
-            [
-                "marimo",
-                "export",
-                "script",
-                temp_marimo_file,
-                "--watch",
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
-
-        # Should return an error
-        while True:
-            line = p.stderr.readline().decode()
-            if line:
-                assert (
-                    "Cannot use --watch without providing "
-                    + "an output file with --output."
-                    in line
-                )
-                break
+    @pytest.mark.xdist_group(name="export_watch")
+    async def test_export_watch_script_no_out_dir(
+        temp_marimo_file: str,
+    ) -> None:
+        p = await _watch_export("script", temp_marimo_file, "--watch")
+        try:
+            # Should return an error
+            line = await _readline(p.stderr)
+            assert _WATCH_ERROR_MESSAGE in line
+        finally:
+            await _kill(p)
@@ -14,13 +14,31 @@ class TestUserConfigManager(unittest.TestCase):
         mock_load.return_value = mock_config
         manager = UserConfigManager()
 
-        result = manager.save_config(mock_config)
+        result = manager.save_config(
+            merge_default_config(MarimoConfig(keymap={"preset": "vim"}))
+        )
 
         mock_load.assert_called_once()
         assert result == manager.config
+        assert result["keymap"]["preset"] == "vim"
 
         assert mock_dump.mock_calls[0][1][0] == result
 
+    @patch("tomlkit.dump")
+    @patch("marimo._config.manager.load_config")
+    def test_save_config_skips_unchanged(
+        self, mock_load: Any, mock_dump: Any
+    ) -> None:
+        mock_config = merge_default_config(MarimoConfig())
+        mock_load.return_value = mock_config
+        manager = UserConfigManager()
+
+        result = manager.save_config(mock_config)
+
+        # No-op saves don't write to disk
+        assert result == manager.config
+        mock_dump.assert_not_called()
+
     @patch("tomlkit.dump")
     @patch("marimo._config.manager.load_config")
     def test_can_save_secrets(self, mock_load: Any, mock_dump: Any) -> None:
@@ -39,14 +57,16 @@ class TestUserConfigManager(unittest.TestCase):
             == "super_secret"
         )
 
-        # Do not overwrite secrets
+        # Do not overwrite secrets; saving back the placeholder is a
+        # no-op, so nothing is written
         manager.save_config(
             merge_default_config(
                 MarimoConfig(ai={"open_ai": {"api_key": "********"}})
             )
         )
+        assert mock_dump.call_count == 1
         assert (
-            mock_dump.mock_calls[1][1][0]["ai"]["open_ai"]["api_key"]
+            manager.get_config(hide_secrets=False)["ai"]["open_ai"]["api_key"]
             == "super_secret"
         )
 
@@ -0,0 +1,32 @@
+# Copyright 2024 Marimo. All rights reserved.
+from marimo._plugins.stateless.lazy import lazy
+from marimo._runtime.functions import EmptyArgs
+
+
+def test_load_invokes_function_each_time() -> None:
+    calls = 0
+
+    def element() -> str:
+        nonlocal calls
+        calls += 1
+        return "contents"
+
+    el = lazy(element)
+    el.load(EmptyArgs())
+    el.load(EmptyArgs())
+    assert calls == 2
+
+
+def test_load_caches_when_deps_unchanged() -> None:
+    calls = 0
+
+    def element() -> str:
+        nonlocal calls
+        calls += 1
+        return "contents"
+
+    el = lazy(element, deps=())
+    first = el.load(EmptyArgs())
+    second = el.load(EmptyArgs())
+    assert calls == 1
+    assert first == second
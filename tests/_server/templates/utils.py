@@ -5,6 +5,10 @@ import re
 
 from marimo import __version__
 
+# One pattern per quote style; href and src are normalized identically.
+_DOUBLE_QUOTED_URL = re.compile(r'(?:href|src)="[^"]+"')
+_SINGLE_QUOTED_URL = re.compile(r"(?:href|src)='[^']+'")
+
 
 def remove_hash_from_href(url: str) -> str:
     base, ext = os.path.splitext(url)
@@ -19,23 +23,11 @@ def normalize_index_html(index_html: str) -> str:
     # Remove the hash from the URLs in the index.html
     # And remove the version
     # This is so the snapshots can stay stable across versions
-    index_html = re.sub(
-        r'href="[^"]+"',
-        lambda x: remove_hash_from_href(x.group(0)),
-        index_html,
-    )
-    index_html = re.sub(
-        r"href='[^']+'",
-        lambda x: remove_hash_from_href(x.group(0)),
-        index_html,
-    )
-    index_html = re.sub(
-        r'src="[^"]+"',
+    index_html = _DOUBLE_QUOTED_URL.sub(
         lambda x: remove_hash_from_href(x.group(0)),
         index_html,
     )
-    index_html = re.sub(
-        r"src='[^']+'",
+    index_html = _SINGLE_QUOTED_URL.sub(
         lambda x: remove_hash_from_href(x.group(0)),
         index_html,
     )